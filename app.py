@@ -1,8 +1,11 @@
 import streamlit as st
-import google.generativeai as genai
 from pydantic import BaseModel, Field
-from typing import List, Literal
-import json
+from typing import TYPE_CHECKING, List, Literal
+import hashlib
+import io
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 # --- 1. CONFIGURATION ---
 st.set_page_config(page_title="Agile Documentation Generator", page_icon="📑", layout="wide")
@@ -57,7 +60,123 @@ class DocumentationPackage(BaseModel):
     risk_register: List[RiskAssumption]
     release_notes_draft: List[ReleaseNoteEntry]
 
-# --- 3. APP LOGIC ---
+@st.cache_resource
+def get_model(api_key: str, name: str) -> "genai.GenerativeModel":
+    """Configure Gemini and build the model once per (API key, model) pair."""
+    # Imported lazily: the SDK is heavy and only needed once the user generates
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(
+        model_name=name,
+        generation_config={
+            "response_mime_type": "application/json",
+            "response_schema": DocumentationPackage
+        }
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def generate_package(api_key_hash: str, model_choice: str, transcript: str, _api_key: str) -> dict:
+    """Call Gemini once per (key, model, transcript); reruns and repeat clicks hit the cache.
+
+    The reply is validated here so an invalid one raises and is never cached.
+    """
+    model = get_model(_api_key, model_choice)
+    prompt = f"""
+                You are a Senior Technical Product Manager.
+                Analyze the transcript and produce a formal Agile documentation package.
+                
+                CRITICAL INSTRUCTIONS:
+                1. **Complexity (Not Points):** Do not assign Story Points. Instead, estimate T-Shirt size (S, M, L) based on implied complexity.
+                2. **Definition of Ready:** If a requirement is vague (e.g. "needs a tag") but lacks detail (e.g. "where does the tag go?"), mark it as "Needs Refinement".
+                3. **Decisions:** Extract specific architectural or scope decisions (e.g. "Killing the Export feature").
+                
+                TRANSCRIPT:
+                {transcript}
+                """
+    response = model.generate_content(prompt)
+    return DocumentationPackage.model_validate_json(response.text).model_dump()
+
+# --- 3. RENDERING ---
+# Each panel is a fragment, so interacting with it reruns only that panel
+# instead of the whole script (and the Gemini call path above it).
+
+COMPLEXITY_COLOR = {
+    "XS": "green",
+    "S": "green",
+    "M": "orange",
+    "L": "red",
+    "XL": "red",
+    "Needs Discussion": "orange",
+}
+
+STATUS_ICON = {
+    "Ready for Sprint": "✅",
+    "Needs Refinement": "⚠️",
+}
+
+@st.fragment
+def render_backlog(items: tuple[BacklogItem, ...]):
+    st.subheader("Updated Product Backlog")
+    
+    # Simple stats
+    ready_count = sum(1 for item in items if item.definition_of_ready_status == "Ready for Sprint")
+    st.caption(f"Ready: {ready_count} / {len(items)} Items")
+
+    for item in items:
+        # Expander Header
+        header = (
+            f"{STATUS_ICON[item.definition_of_ready_status]} [{item.priority}] {item.title} — "
+            f":{COMPLEXITY_COLOR[item.complexity]}[Size: {item.complexity}]"
+        )
+        
+        with st.expander(header):
+            st.markdown(f"**User Story:** {item.user_story}")
+            
+            # Show Missing Info prominently if it exists
+            if item.missing_info and item.missing_info.strip():
+                st.error(f"**Needs Refinement:** {item.missing_info}")
+            
+            st.markdown("**Acceptance Criteria:**")
+            for ac in item.acceptance_criteria:
+                st.markdown(f"- `{ac.test_type}` {ac.condition}")
+
+@st.fragment
+def render_governance(decisions: tuple[DecisionNote, ...], risks: tuple[RiskAssumption, ...]):
+    c1, c2 = st.columns(2)
+    with c1:
+        st.subheader("📝 Decision Log")
+        if not decisions:
+            st.info("No major decisions recorded.")
+        for d in decisions:
+            st.success(f"**{d.topic}**\n\nDecision: {d.decision_made}\n\n*Rationale: {d.rationale}*")
+    
+    with c2:
+        st.subheader("🛡️ Risk Register")
+        if not risks:
+            st.info("No high-level risks recorded.")
+        for r in risks:
+            st.warning(f"**{r.category}: {r.description}**\n\nMitigation: {r.mitigation_strategy}")
+
+def release_note_entry(note: ReleaseNoteEntry) -> str:
+    return f"**{note.feature_name}** ({note.audience})\n{note.value_statement}\n\n"
+
+def build_release_notes(notes: tuple[ReleaseNoteEntry, ...]) -> str:
+    """Assemble the downloadable release notes; only runs when the button is clicked."""
+    buffer = io.StringIO()
+    buffer.write("## Release Highlights\n\n")
+    for note in notes:
+        buffer.write(release_note_entry(note))
+    return buffer.getvalue()
+
+@st.fragment
+def render_release_notes(notes: tuple[ReleaseNoteEntry, ...]):
+    st.subheader("📢 Draft Release Notes")
+    for note in notes:
+        st.markdown(release_note_entry(note))
+    st.download_button("Download .txt", lambda: build_release_notes(notes), "release_notes.txt")
+
+# --- 4. APP LOGIC ---
 st.title("📑 AI Agile Documenter")
 st.markdown("Generates **Backlog Items (T-Shirt Sized), Decision Logs, and Release Notes**.")
 
@@ -70,31 +189,10 @@ if st.button("Generate Documentation Package", type="primary"):
         st.warning("⚠️ Please enter a transcript to analyze.")
     else:
         try:
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel(
-                model_name=model_choice,
-                generation_config={
-                    "response_mime_type": "application/json",
-                    "response_schema": DocumentationPackage
-                }
-            )
-
             with st.spinner("Drafting formal documentation..."):
-                prompt = f"""
-                You are a Senior Technical Product Manager.
-                Analyze the transcript and produce a formal Agile documentation package.
-                
-                CRITICAL INSTRUCTIONS:
-                1. **Complexity (Not Points):** Do not assign Story Points. Instead, estimate T-Shirt size (S, M, L) based on implied complexity.
-                2. **Definition of Ready:** If a requirement is vague (e.g. "needs a tag") but lacks detail (e.g. "where does the tag go?"), mark it as "Needs Refinement".
-                3. **Decisions:** Extract specific architectural or scope decisions (e.g. "Killing the Export feature").
-                
-                TRANSCRIPT:
-                {transcript}
-                """
-                response = model.generate_content(prompt)
-                data = json.loads(response.text)
-                docs = DocumentationPackage(**data)
+                api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+                package = generate_package(api_key_hash, model_choice, transcript, api_key)
+                docs = DocumentationPackage.model_validate(package)
 
             st.success("Documentation Generated Successfully!")
             
@@ -108,63 +206,19 @@ if st.button("Generate Documentation Package", type="primary"):
 
             # TAB 1: BACKLOG
             with tab1:
-                st.subheader("Updated Product Backlog")
-                
-                # Simple stats
-                ready_count = sum(1 for item in docs.backlog_items if item.definition_of_ready_status == "Ready for Sprint")
-                st.caption(f"Ready: {ready_count} / {len(docs.backlog_items)} Items")
-
-                for item in docs.backlog_items:
-                    # Status Icons
-                    status_icon = "✅" if item.definition_of_ready_status == "Ready for Sprint" else "⚠️"
-                    
-                    # Complexity Badge Color
-                    complexity_color = "red" if item.complexity in ["L", "XL"] else "green" if item.complexity in ["XS", "S"] else "orange"
-                    
-                    # Expander Header
-                    header = f"{status_icon} [{item.priority}] {item.title} — :{complexity_color}[Size: {item.complexity}]"
-                    
-                    with st.expander(header):
-                        st.markdown(f"**User Story:** {item.user_story}")
-                        
-                        # Show Missing Info prominently if it exists
-                        if item.missing_info and item.missing_info.strip():
-                            st.error(f"**Needs Refinement:** {item.missing_info}")
-                        
-                        st.markdown("**Acceptance Criteria:**")
-                        for ac in item.acceptance_criteria:
-                            st.markdown(f"- `{ac.test_type}` {ac.condition}")
+                render_backlog(tuple(docs.backlog_items))
 
             # TAB 2: GOVERNANCE
             with tab2:
-                c1, c2 = st.columns(2)
-                with c1:
-                    st.subheader("📝 Decision Log")
-                    if not docs.decision_log:
-                        st.info("No major decisions recorded.")
-                    for d in docs.decision_log:
-                        st.success(f"**{d.topic}**\n\nDecision: {d.decision_made}\n\n*Rationale: {d.rationale}*")
-                
-                with c2:
-                    st.subheader("🛡️ Risk Register")
-                    if not docs.risk_register:
-                        st.info("No high-level risks recorded.")
-                    for r in docs.risk_register:
-                        st.warning(f"**{r.category}: {r.description}**\n\nMitigation: {r.mitigation_strategy}")
+                render_governance(tuple(docs.decision_log), tuple(docs.risk_register))
 
             # TAB 3: STAKEHOLDERS
             with tab3:
-                st.subheader("📢 Draft Release Notes")
-                txt_output = "## Release Highlights\n\n"
-                for note in docs.release_notes_draft:
-                    entry = f"**{note.feature_name}** ({note.audience})\n{note.value_statement}\n\n"
-                    st.markdown(entry)
-                    txt_output += entry
-                st.download_button("Download .txt", txt_output, "release_notes.txt")
+                render_release_notes(tuple(docs.release_notes_draft))
 
             # TAB 4: RAW DATA
             with tab4:
-                st.json(data)
+                st.json(docs.model_dump())
 
         except Exception as e:
             st.error(f"Error parsing response: {e}")
\ No newline at end of file
@@ -1,23 +1,40 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-import google.generativeai as genai
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 import os
-import json
+import orjson
+import asyncio
+import hashlib
+import time
+import redis.asyncio as redis
+from cachetools import TTLCache
 from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, List
+from uuid import uuid4
+from schema import response_schema
+from streaming import PackageStreamParser
 from models import (
     TranscriptRequest, 
     DocumentationPackage, 
+    BatchResult,
     HealthResponse
 )
 
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
 load_dotenv()
 
 app = FastAPI(
     title="AI Agile Companion API",
     description="Generates Agile documentation from meeting transcripts",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -34,40 +51,378 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Server-Sent Events must reach the client as they are produced; the gzip
+# compressor would hold them back until its buffer fills
+UNCOMPRESSED_PATHS = {"/api/generate/stream"}
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip responses except those on UNCOMPRESSED_PATHS"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compression
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Rate limiting for demo mode
-demo_usage = defaultdict(list)
 DEMO_LIMIT = 5
 DEMO_WINDOW = 3600
 
+# Per-IP request timestamps, least recently seen first; capped so a flood
+# of distinct IPs cannot grow it without bound
+DEMO_MAX_CLIENTS = 100_000
+DEMO_SWEEP_INTERVAL = 300
+demo_usage: "OrderedDict[str, deque[datetime]]" = OrderedDict()
+
+# Cache of generated packages for repeated transcripts
+response_cache = TTLCache(maxsize=1024, ttl=3600)
+
+# Transcript size limits; MAX keeps input around 15k tokens
+MIN_TRANSCRIPT_CHARS = 100
+MAX_TRANSCRIPT_CHARS = 60_000
+MIN_TRANSCRIPT_WORDS = 20
+
+# Maximum transcripts accepted by a single batch request
+MAX_BATCH_SIZE = 10
+
+# Small batches are answered by one combined Gemini call; the output
+# token budget, not the input size, is what limits how many fit
+COMBINED_BATCH_MAX_ITEMS = 3
+COMBINED_BATCH_MAX_CHARS = 100_000
+
+# Maximum output tokens each model can produce in one response
+MODEL_OUTPUT_TOKEN_LIMITS = {
+    "gemini-2.5-pro": 65_536,
+    "gemini-2.5-flash": 65_536,
+    "gemini-2.0-flash": 8_192,
+}
+
 # Configure Gemini
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 DEMO_MODE = os.getenv("DEMO_MODE", "true").lower() == "true"
 
-# Configure API key ONCE at startup
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-else:
+if not GEMINI_API_KEY:
     print("WARNING: GEMINI_API_KEY not set!")
 
-def check_rate_limit(client_ip: str) -> bool:
-    """Check if client has exceeded demo rate limit"""
+# Share rate-limit state across workers when Redis is available
+REDIS_URL = os.getenv("REDIS_URL")
+redis_client = redis.from_url(REDIS_URL) if REDIS_URL else None
+
+# Model used to open the Gemini connection at startup
+WARMUP_MODEL = "gemini-2.5-flash"
+
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "max_output_tokens": 8192,
+    "response_mime_type": "application/json",
+    "response_schema": response_schema(DocumentationPackage),
+}
+
+
+@lru_cache(maxsize=1)
+def get_genai():
+    """
+    Import and configure the Gemini SDK on first use.
+    
+    The SDK pulls in gRPC, protobuf and google-auth, so importing it lazily
+    keeps process start-up and endpoints like /health fast.
+    """
+    import google.generativeai as genai
+    
+    # Configure API key ONCE per process
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai
+
+@lru_cache(maxsize=8)
+def get_model(name: str) -> "genai.GenerativeModel":
+    """Return a shared GenerativeModel per model name"""
+    return get_genai().GenerativeModel(name, generation_config=GENERATION_CONFIG)
+
+@lru_cache(maxsize=16)
+def get_batch_model(name: str, items: int) -> "genai.GenerativeModel":
+    """Return a shared GenerativeModel that answers with a list of `items` packages"""
+    generation_config = {
+        **GENERATION_CONFIG,
+        "max_output_tokens": items * GENERATION_CONFIG["max_output_tokens"],
+        "response_schema": response_schema(list[DocumentationPackage]),
+    }
+    return get_genai().GenerativeModel(name, generation_config=generation_config)
+
+async def check_rate_limit(client_ip: str, cost: int = 1) -> bool:
+    """
+    Check if client has room for `cost` more requests and, if so, record them.
+    
+    Either all `cost` requests are recorded or none are, so a rejected
+    batch does not use up the client's window.
+    """
     if not DEMO_MODE:
         return True
     
+    if cost > DEMO_LIMIT:
+        return False
+    
+    if redis_client is not None:
+        try:
+            return await check_rate_limit_redis(client_ip, cost)
+        except redis.RedisError as e:
+            # Keep serving with a per-worker limit while Redis is unreachable
+            print(f"Redis rate limit unavailable, using in-memory limit: {str(e)}")
+    
+    return check_rate_limit_memory(client_ip, cost)
+
+def check_rate_limit_memory(client_ip: str, cost: int = 1) -> bool:
+    """Sliding-window rate limit kept in this worker's memory"""
     now = datetime.now()
     cutoff = now - timedelta(seconds=DEMO_WINDOW)
     
-    demo_usage[client_ip] = [
-        timestamp for timestamp in demo_usage[client_ip]
-        if timestamp > cutoff
-    ]
+    usage = demo_usage.get(client_ip)
+    if usage is None:
+        usage = demo_usage[client_ip] = deque(maxlen=DEMO_LIMIT)
+        if len(demo_usage) > DEMO_MAX_CLIENTS:
+            demo_usage.popitem(last=False)
+    else:
+        demo_usage.move_to_end(client_ip)
     
-    if len(demo_usage[client_ip]) >= DEMO_LIMIT:
+    # The deque holds the client's last DEMO_LIMIT requests in time order,
+    # so counting the ones still inside the window is bounded by DEMO_LIMIT
+    used = sum(1 for timestamp in usage if timestamp > cutoff)
+    if used + cost > DEMO_LIMIT:
         return False
     
-    demo_usage[client_ip].append(now)
+    usage.extend([now] * cost)
     return True
 
+async def sweep_demo_usage():
+    """Periodically drop clients whose requests have all left the window"""
+    while True:
+        await asyncio.sleep(DEMO_SWEEP_INTERVAL)
+        cutoff = datetime.now() - timedelta(seconds=DEMO_WINDOW)
+        expired = [
+            client_ip for client_ip, usage in demo_usage.items()
+            if not usage or usage[-1] <= cutoff
+        ]
+        for client_ip in expired:
+            del demo_usage[client_ip]
+
+async def check_rate_limit_redis(client_ip: str, cost: int = 1) -> bool:
+    """Sliding-window rate limit backed by a Redis sorted set"""
+    key = f"rl:{client_ip}"
+    members = {str(uuid4()): time.time() for _ in range(cost)}
+    now = max(members.values())
+    
+    pipe = redis_client.pipeline()
+    pipe.zremrangebyscore(key, 0, now - DEMO_WINDOW)
+    pipe.zadd(key, members)
+    pipe.zcard(key)
+    pipe.expire(key, DEMO_WINDOW)
+    _, _, count, _ = await pipe.execute()
+    
+    if count > DEMO_LIMIT:
+        # Rejected requests should not use up the window
+        await redis_client.zrem(key, *members)
+        return False
+    
+    return True
+
+# Static prompt text, built once at import; only the transcript is spliced in per request
+PROMPT_INSTRUCTIONS = """
+You are a Senior Technical Product Manager with expertise in Agile/Scrum methodology.
+Analyze the following meeting transcript and produce a formal Agile documentation package.
+
+CRITICAL INSTRUCTIONS:
+1. **Complexity:** Estimate T-Shirt size (XS, S, M, L, XL) based on implied complexity.
+2. **Definition of Ready:** If vague, mark as "Needs Refinement" with missing info.
+3. **Decisions:** Extract key architectural/scope decisions.
+4. **Risks:** Identify technical risks and dependencies.
+5. **Release Notes:** Write concise, non-technical summaries.
+6. **SCOPE SENTINEL:** Flag scope creep indicators.
+
+RULES:
+- Keep quotes under 20 words
+- Maximum 5 backlog items
+- Maximum 3 acceptance criteria per item
+- Maximum 3 scope alerts
+"""
+PROMPT_HEAD = PROMPT_INSTRUCTIONS + "\nTRANSCRIPT:\n"
+PROMPT_TAIL = "\n"
+BATCH_PROMPT_HEAD = PROMPT_INSTRUCTIONS + """
+Each transcript below starts with a "=== TRANSCRIPT n ===" line. Return a JSON
+list with exactly one documentation package per transcript, in the same order.
+"""
+
+def build_prompt(transcript: str) -> str:
+    """Build the documentation prompt for a transcript"""
+    return PROMPT_HEAD + transcript + PROMPT_TAIL
+
+def build_batch_prompt(transcripts: List[str]) -> str:
+    """Build one prompt covering several delimited transcripts"""
+    sections = [
+        f"\n=== TRANSCRIPT {i} ===\n{transcript}\n"
+        for i, transcript in enumerate(transcripts, start=1)
+    ]
+    return BATCH_PROMPT_HEAD + "".join(sections)
+
+# Parses and validates Gemini output in a single pydantic-core pass
+DOCUMENTATION_ADAPTER = TypeAdapter(DocumentationPackage)
+BATCH_ADAPTER = TypeAdapter(List[DocumentationPackage])
+
+def parse_documentation(response_text: str) -> DocumentationPackage:
+    """Parse and validate the raw Gemini output"""
+    return DOCUMENTATION_ADAPTER.validate_json(response_text)
+
+def check_transcript(transcript: str):
+    """Reject transcripts that would waste a Gemini call"""
+    if not transcript.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Transcript cannot be empty"
+        )
+    
+    if len(transcript) > MAX_TRANSCRIPT_CHARS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Transcript too long ({len(transcript)} > {MAX_TRANSCRIPT_CHARS} characters)."
+        )
+    
+    if len(transcript) < MIN_TRANSCRIPT_CHARS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Transcript too short. Provide at least {MIN_TRANSCRIPT_CHARS} characters."
+        )
+    
+    # Cheap word-count proxy that filters out pasted junk
+    if transcript.count(" ") < MIN_TRANSCRIPT_WORDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Transcript too short. Provide at least {MIN_TRANSCRIPT_WORDS} words."
+        )
+
+def check_api_configured():
+    """Reject requests while no Gemini API key is configured"""
+    if not GEMINI_API_KEY:
+        raise HTTPException(
+            status_code=500, 
+            detail="Service temporarily unavailable. API key not configured."
+        )
+
+async def charge_rate_limit(req: Request, cost: int = 1):
+    """Record `cost` requests against the client's rate limit, or reject them all"""
+    client_ip = req.client.host
+    if not await check_rate_limit(client_ip, cost):
+        raise HTTPException(
+            status_code=429,
+            detail=f"Demo mode: Rate limit exceeded. You can make {DEMO_LIMIT} requests per hour."
+        )
+
+async def validate_generation_request(request: TranscriptRequest, req: Request, cached: bool = False):
+    """Reject requests that cannot be served before calling Gemini"""
+    check_api_configured()
+    
+    # Validate input before it uses up the client's rate limit
+    check_transcript(request.transcript)
+    
+    # Cached packages never reach Gemini, so they do not count against the limit
+    if not cached:
+        await charge_rate_limit(req)
+
+def cache_key(request: TranscriptRequest) -> str:
+    """Key a request by model and transcript contents"""
+    return hashlib.sha256(
+        (request.model_choice + "\x00" + request.transcript).encode()
+    ).hexdigest()
+
+async def generate_package(request: TranscriptRequest, use_cache: bool = True) -> DocumentationPackage:
+    """Run one transcript through Gemini without blocking the event loop"""
+    key = cache_key(request)
+    if use_cache and key in response_cache:
+        return response_cache[key]
+    
+    model = get_model(request.model_choice)
+    response = await model.generate_content_async(
+        build_prompt(request.transcript)
+    )
+    documentation = parse_documentation(response.text)
+    response_cache[key] = documentation
+    return documentation
+
+def can_combine(requests: List[TranscriptRequest]) -> bool:
+    """Check whether a batch fits in a single combined Gemini call"""
+    if not 1 < len(requests) <= COMBINED_BATCH_MAX_ITEMS:
+        return False
+    
+    model_choices = {request.model_choice for request in requests}
+    if len(model_choices) != 1:
+        return False
+    
+    # Each package gets the same output budget as a single request would
+    output_tokens = len(requests) * GENERATION_CONFIG["max_output_tokens"]
+    return (
+        output_tokens <= MODEL_OUTPUT_TOKEN_LIMITS.get(model_choices.pop(), 0)
+        and sum(len(request.transcript) for request in requests) < COMBINED_BATCH_MAX_CHARS
+    )
+
+async def generate_combined(requests: List[TranscriptRequest]):
+    """Generate packages for several transcripts in one call and cache them"""
+    model = get_batch_model(requests[0].model_choice, len(requests))
+    response = await model.generate_content_async(
+        build_batch_prompt([request.transcript for request in requests])
+    )
+    packages = BATCH_ADAPTER.validate_json(response.text)
+    if len(packages) != len(requests):
+        raise ValueError(f"Expected {len(requests)} packages, got {len(packages)}")
+    
+    for request, documentation in zip(requests, packages):
+        response_cache[cache_key(request)] = documentation
+
+def sse_event(payload: dict) -> bytes:
+    """Format a payload as a Server-Sent Events message"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+# Keep references to fire-and-forget tasks so they are not garbage collected
+background_tasks = set()
+
+@app.on_event("startup")
+async def start_gemini_warmup():
+    """Warm up Gemini in the background so start-up is not delayed"""
+    if not GEMINI_API_KEY:
+        return
+    
+    task = asyncio.create_task(warm_gemini_connection())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+@app.on_event("startup")
+async def start_demo_usage_sweep():
+    """Expire in-memory rate-limit state, also used when Redis is unreachable"""
+    if not DEMO_MODE:
+        return
+    
+    task = asyncio.create_task(sweep_demo_usage())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+async def warm_gemini_connection():
+    """
+    Load the SDK and open the shared Gemini connection before the first
+    request arrives.
+    
+    The SDK keeps one async gRPC client (a single multiplexed HTTP/2
+    channel) per process; a token count on it pays the DNS lookup and
+    TLS handshake up front instead of on the first user request.
+    """
+    try:
+        # Import off the event loop so requests are served meanwhile
+        await asyncio.to_thread(get_genai)
+        await asyncio.wait_for(
+            get_model(WARMUP_MODEL).count_tokens_async("ping"),
+            timeout=10
+        )
+    except Exception as e:
+        print(f"WARNING: Gemini warm-up failed: {str(e)}")
+
 @app.get("/")
 def read_root():
     return {
@@ -75,7 +430,9 @@ def read_root():
         "demo_mode": DEMO_MODE,
         "endpoints": {
             "/health": "Health check",
-            "/api/generate": "Generate documentation from transcript"
+            "/api/generate": "Generate documentation from transcript",
+            "/api/generate/stream": "Stream documentation generation as Server-Sent Events",
+            "/api/generate_batch": "Generate documentation for several transcripts"
         }
     }
 
@@ -88,141 +445,22 @@ def health_check():
     )
 
 @app.post("/api/generate", response_model=DocumentationPackage)
-async def generate_documentation(request: TranscriptRequest, req: Request):
+async def generate_documentation(request: TranscriptRequest, req: Request, nocache: bool = False):
     """
     Generate complete Agile documentation package from meeting transcript.
-    """
-    if not GEMINI_API_KEY:
-        raise HTTPException(
-            status_code=500, 
-            detail="Service temporarily unavailable. API key not configured."
-        )
     
-    # Check rate limit
-    client_ip = req.client.host
-    if not check_rate_limit(client_ip):
-        raise HTTPException(
-            status_code=429,
-            detail=f"Demo mode: Rate limit exceeded. You can make {DEMO_LIMIT} requests per hour."
-        )
-    
-    if not request.transcript.strip():
-        raise HTTPException(
-            status_code=400,
-            detail="Transcript cannot be empty"
-        )
+    Pass `?nocache=1` to bypass the response cache and force regeneration.
+    """
+    cached = None if nocache else response_cache.get(cache_key(request))
+    await validate_generation_request(request, req, cached=cached is not None)
     
     try:
-        # Create model
-        model = genai.GenerativeModel(request.model_choice)
+        documentation = cached or await generate_package(request, use_cache=False)
         
-        generation_config = {
-            "temperature": 0.7,
-            "max_output_tokens": 8192,
-        }
+        # Serialize once in pydantic-core rather than re-validating through response_model
+        return Response(content=documentation.model_dump_json(), media_type="application/json")
         
-        prompt = f"""
-You are a Senior Technical Product Manager with expertise in Agile/Scrum methodology.
-Analyze the following meeting transcript and produce a formal Agile documentation package.
-
-CRITICAL INSTRUCTIONS:
-1. **Complexity:** Estimate T-Shirt size (XS, S, M, L, XL) based on implied complexity.
-2. **Definition of Ready:** If vague, mark as "Needs Refinement" with missing info.
-3. **Decisions:** Extract key architectural/scope decisions.
-4. **Risks:** Identify technical risks and dependencies.
-5. **Release Notes:** Write concise, non-technical summaries.
-6. **SCOPE SENTINEL:** Flag scope creep indicators.
-
-TRANSCRIPT:
-{request.transcript}
-
-Respond with ONLY valid JSON (no markdown):
-
-{{
-  "meeting_summary": "2-3 sentence summary",
-  "backlog_items": [
-    {{
-      "id": "PBI-001",
-      "title": "Short title",
-      "user_story": "As a [user], I want [goal], so that [benefit]",
-      "priority": "Must Have",
-      "complexity": "M",
-      "definition_of_ready_status": "Ready for Sprint",
-      "missing_info": "",
-      "acceptance_criteria": [
-        {{"condition": "Testable condition", "test_type": "Functional"}}
-      ]
-    }}
-  ],
-  "decision_log": [
-    {{"topic": "Topic", "decision_made": "Decision", "rationale": "Why", "owner": "Who"}}
-  ],
-  "risk_register": [
-    {{"category": "Risk", "description": "Description", "impact": "High", "mitigation_strategy": "How to address"}}
-  ],
-  "release_notes_draft": [
-    {{"feature_name": "Feature", "value_statement": "User benefit", "audience": "External Customers"}}
-  ],
-  "scope_sentinel": {{
-    "overall_risk": "Medium",
-    "summary": "Brief scope assessment (1-2 sentences)",
-    "alerts": [
-      {{
-        "severity": "Medium",
-        "category": "Feature Creep",
-        "description": "Brief description",
-        "quote": "Brief quote (max 20 words)",
-        "recommendation": "Brief recommendation",
-        "impacted_items": ["PBI-001"]
-      }}
-    ],
-    "metrics": {{
-      "features_discussed": 5,
-      "new_items_added": 2,
-      "complexity_increases": 1,
-      "unclear_requirements": 3
-    }}
-  }}
-}}
-
-RULES:
-- Keep quotes under 20 words
-- Maximum 5 backlog items
-- Maximum 3 acceptance criteria per item
-- Maximum 3 scope alerts
-- Be concise but complete
-
-Valid values:
-- priority: "Must Have", "Should Have", "Could Have", "Won't Have"
-- complexity: "XS", "S", "M", "L", "XL", "Needs Discussion"
-- definition_of_ready_status: "Ready for Sprint", "Needs Refinement"
-- test_type: "Functional", "UI/UX", "Security", "Performance", "Regression"
-- category (risk): "Risk", "Assumption", "Dependency"
-- impact: "High", "Medium", "Low"
-- audience: "Internal Users", "External Customers", "Admins", "Developers"
-- severity: "Low", "Medium", "High", "Critical"
-- category (scope): "Feature Creep", "Scope Expansion", "Timeline Pressure", "Unclear Requirements", "Technical Debt", "Resource Constraint"
-- overall_risk: "Low", "Medium", "High", "Critical"
-"""
-        
-        # Generate content
-        response = model.generate_content(prompt, generation_config=generation_config)
-        response_text = response.text.strip()
-        
-        # Clean up response
-        if response_text.startswith("```"):
-            lines = response_text.split('\n')
-            response_text = '\n'.join(lines[1:-1])
-        
-        # Parse JSON
-        data = json.loads(response_text)
-        
-        # Validate with Pydantic
-        documentation = DocumentationPackage(**data)
-        
-        return documentation
-        
-    except json.JSONDecodeError as e:
+    except ValidationError as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to parse response. Please try again."
@@ -235,6 +473,124 @@ Valid values:
             detail=f"Error generating documentation: {str(e)}"
         )
 
+@app.post("/api/generate/stream")
+async def stream_documentation(request: TranscriptRequest, req: Request, nocache: bool = False):
+    """
+    Stream the documentation package as Server-Sent Events.
+    
+    Emits the `meeting_summary` and each backlog item, decision and risk
+    as soon as Gemini finishes generating it, in whatever order Gemini
+    writes them, then a final `done` event carrying the validated package
+    (or an `error` event on failure).
+    Cached packages are sent as a single `done` event.
+    """
+    key = cache_key(request)
+    cached = None if nocache else response_cache.get(key)
+    await validate_generation_request(request, req, cached=cached is not None)
+    
+    model = get_model(request.model_choice)
+    
+    async def event_gen():
+        if cached is not None:
+            yield sse_event({"done": True, "package": orjson.Fragment(cached.model_dump_json())})
+            return
+        
+        chunks = []
+        parser = PackageStreamParser()
+        try:
+            response = await model.generate_content_async(
+                build_prompt(request.transcript),
+                stream=True
+            )
+            async for chunk in response:
+                # Chunks without parts (e.g. a trailing finish_reason) raise on .text
+                text = chunk.text if chunk.parts else ""
+                if not text:
+                    continue
+                chunks.append(text)
+                for update in parser.feed(text):
+                    yield sse_event(update)
+            
+            documentation = parse_documentation("".join(chunks))
+            response_cache[key] = documentation
+            yield sse_event({"done": True, "package": orjson.Fragment(documentation.model_dump_json())})
+            
+        except ValidationError:
+            yield sse_event({"error": "Failed to parse response. Please try again."})
+        except Exception as e:
+            print(f"Error streaming documentation: {str(e)}")
+            yield sse_event({"error": f"Error generating documentation: {str(e)}"})
+    
+    return StreamingResponse(
+        event_gen(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/generate_batch", response_model=List[BatchResult])
+async def generate_documentation_batch(requests: List[TranscriptRequest], req: Request):
+    """
+    Generate documentation packages for several transcripts.
+    
+    Small batches sharing a model are sent to Gemini as one combined
+    prompt; larger ones (or a failed combined call) run one request per
+    transcript concurrently. Each uncached transcript counts against the
+    demo rate limit; a batch that does not fit in the client's remaining
+    quota is rejected without using any of it. A failure in one transcript
+    is reported in its result and does not fail the batch.
+    """
+    if not requests:
+        raise HTTPException(
+            status_code=400,
+            detail="Batch cannot be empty"
+        )
+    
+    if len(requests) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch too large. Submit at most {MAX_BATCH_SIZE} transcripts per request."
+        )
+    
+    # A larger batch could never fit in a demo client's hourly quota
+    if DEMO_MODE and len(requests) > DEMO_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch too large. Demo mode allows at most {DEMO_LIMIT} transcripts per request."
+        )
+    
+    check_api_configured()
+    for request in requests:
+        check_transcript(request.transcript)
+    
+    # Only transcripts that will reach Gemini count against the rate limit,
+    # and they are charged together so a rejected batch costs nothing
+    uncached = [request for request in requests if cache_key(request) not in response_cache]
+    if uncached:
+        await charge_rate_limit(req, len(uncached))
+    
+    # Answer small batches with one call; anything it does not produce
+    # falls through to the per-transcript calls below
+    if can_combine(uncached):
+        try:
+            await generate_combined(uncached)
+        except Exception as e:
+            print(f"Combined batch failed, generating transcripts individually: {str(e)}")
+    
+    tasks = [generate_package(request) for request in requests]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    batch = []
+    for result in results:
+        if isinstance(result, ValidationError):
+            batch.append(BatchResult(error="Failed to parse response. Please try again."))
+        elif isinstance(result, Exception):
+            print(f"Error generating documentation: {str(result)}")
+            batch.append(BatchResult(error=f"Error generating documentation: {str(result)}"))
+        else:
+            batch.append(BatchResult(documentation=result))
+    
+    return batch
+
 @app.get("/api/stats")
 async def get_statistics():
     """
@@ -245,3 +601,16 @@ async def get_statistics():
         "items_generated": 0,
         "avg_items_per_session": 0
     }
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # uvloop and httptools ship with uvicorn[standard]
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
@@ -1,21 +1,81 @@
+from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Literal
+from typing import List, Literal, Optional
+
+class Priority(str, Enum):
+    MUST = "Must Have"
+    SHOULD = "Should Have"
+    COULD = "Could Have"
+    WONT = "Won't Have"
+
+class Complexity(str, Enum):
+    """Estimated T-shirt size complexity."""
+    XS = "XS"
+    S = "S"
+    M = "M"
+    L = "L"
+    XL = "XL"
+    NEEDS_DISCUSSION = "Needs Discussion"
+
+class TestType(str, Enum):
+    FUNCTIONAL = "Functional"
+    UI_UX = "UI/UX"
+    SECURITY = "Security"
+    PERFORMANCE = "Performance"
+    REGRESSION = "Regression"
+
+class DoRStatus(str, Enum):
+    """Is this story clear enough to start work?"""
+    READY = "Ready for Sprint"
+    NEEDS_REFINEMENT = "Needs Refinement"
+
+class RiskCategory(str, Enum):
+    RISK = "Risk"
+    ASSUMPTION = "Assumption"
+    DEPENDENCY = "Dependency"
+
+class Impact(str, Enum):
+    HIGH = "High"
+    MEDIUM = "Medium"
+    LOW = "Low"
+
+class Audience(str, Enum):
+    INTERNAL_USERS = "Internal Users"
+    EXTERNAL_CUSTOMERS = "External Customers"
+    ADMINS = "Admins"
+    DEVELOPERS = "Developers"
+
+class Severity(str, Enum):
+    LOW = "Low"
+    MEDIUM = "Medium"
+    HIGH = "High"
+    CRITICAL = "Critical"
+
+class ScopeCategory(str, Enum):
+    FEATURE_CREEP = "Feature Creep"
+    SCOPE_EXPANSION = "Scope Expansion"
+    TIMELINE_PRESSURE = "Timeline Pressure"
+    UNCLEAR_REQUIREMENTS = "Unclear Requirements"
+    TECHNICAL_DEBT = "Technical Debt"
+    RESOURCE_CONSTRAINT = "Resource Constraint"
+
+class OverallRisk(str, Enum):
+    LOW = "Low"
+    MEDIUM = "Medium"
+    HIGH = "High"
+    CRITICAL = "Critical"
 
 class AcceptanceCriteria(BaseModel):
     condition: str = Field(..., description="The condition that must be met.")
-    test_type: Literal["Functional", "UI/UX", "Security", "Performance", "Regression"]
+    test_type: TestType
 
 class BacklogItem(BaseModel):
     id: str = Field(..., description="ID like PBI-001")
     title: str = Field(..., description="Short title of the item")
     user_story: str = Field(..., description="As a X, I want Y, so that Z")
-    priority: Literal["Must Have", "Should Have", "Could Have", "Won't Have"]
-    complexity: Literal["XS", "S", "M", "L", "XL", "Needs Discussion"] = Field(
-        ..., description="Estimated T-shirt size complexity."
-    )
-    definition_of_ready_status: Literal["Ready for Sprint", "Needs Refinement"] = Field(
-        ..., description="Is this story clear enough to start work?"
-    )
+    priority: Priority
+    complexity: Complexity
+    definition_of_ready_status: DoRStatus
     missing_info: str = Field(
         ..., description="If not ready, list what is missing. If ready, return an empty string."
     )
@@ -28,9 +88,9 @@ class DecisionNote(BaseModel):
     owner: str = Field(..., description="Who made or owns this decision?")
 
 class RiskAssumption(BaseModel):
-    category: Literal["Risk", "Assumption", "Dependency"]
+    category: RiskCategory
     description: str
-    impact: Literal["High", "Medium", "Low"]
+    impact: Impact
     mitigation_strategy: str
 
 class ReleaseNoteEntry(BaseModel):
@@ -38,18 +98,11 @@ class ReleaseNoteEntry(BaseModel):
     value_statement: str = Field(
         ..., description="Non-technical explanation of value for end-users."
     )
-    audience: Literal["Internal Users", "External Customers", "Admins", "Developers"]
+    audience: Audience
 
 class ScopeAlert(BaseModel):
-    severity: Literal["Low", "Medium", "High", "Critical"]
-    category: Literal[
-        "Feature Creep",
-        "Scope Expansion", 
-        "Timeline Pressure",
-        "Unclear Requirements",
-        "Technical Debt",
-        "Resource Constraint"
-    ]
+    severity: Severity
+    category: ScopeCategory
     description: str
     quote: str = Field(..., description="Exact quote from transcript showing the issue")
     recommendation: str
@@ -57,14 +110,17 @@ class ScopeAlert(BaseModel):
         ..., description="List of PBI IDs that might be affected"
     )
 
+class ScopeMetrics(BaseModel):
+    features_discussed: int = Field(..., description="Number of features discussed")
+    new_items_added: int = Field(..., description="Number of new items raised in the meeting")
+    complexity_increases: int = Field(..., description="Number of items whose complexity grew")
+    unclear_requirements: int = Field(..., description="Number of requirements lacking detail")
+
 class ScopeSentinel(BaseModel):
-    overall_risk: Literal["Low", "Medium", "High", "Critical"]
+    overall_risk: OverallRisk
     summary: str = Field(..., description="Brief assessment of scope health")
     alerts: List[ScopeAlert]
-    metrics: dict = Field(
-        ..., 
-        description="Quantitative metrics like feature_count, new_items_mentioned, etc."
-    )
+    metrics: ScopeMetrics
 
 
 class DocumentationPackage(BaseModel):
@@ -80,6 +136,10 @@ class TranscriptRequest(BaseModel):
     transcript: str
     model_choice: Literal["gemini-2.5-pro", "gemini-2.5-flash", "gemini-2.0-flash"]
 
+class BatchResult(BaseModel):
+    documentation: Optional[DocumentationPackage] = None
+    error: Optional[str] = None
+
 class HealthResponse(BaseModel):
     status: str
     gemini_configured: bool
@@ -0,0 +1,40 @@
+from pydantic import TypeAdapter
+
+# Keys understood by Gemini's response Schema
+SCHEMA_KEYS = ("type", "format", "description", "nullable", "enum", "items", "properties", "required")
+
+def response_schema(annotation) -> dict:
+    """
+    Build a Gemini response schema from a pydantic model or list of models.
+
+    Passing the model class straight to the SDK drops every `required` list,
+    which lets Gemini omit fields the models still require; this keeps them.
+    """
+    schema = TypeAdapter(annotation).json_schema()
+    defs = schema.pop("$defs", {})
+    return _convert(schema, defs)
+
+def _convert(schema: dict, defs: dict) -> dict:
+    # Inline references, keeping any description set next to them
+    if "$ref" in schema:
+        target = defs[schema["$ref"].split("/")[-1]]
+        return _convert({**target, **{k: v for k, v in schema.items() if k != "$ref"}}, defs)
+    if "allOf" in schema and len(schema["allOf"]) == 1:
+        rest = {k: v for k, v in schema.items() if k != "allOf"}
+        return _convert({**schema["allOf"][0], **rest}, defs)
+
+    # Optional[X] becomes a nullable X
+    if "anyOf" in schema:
+        options = [option for option in schema["anyOf"] if option.get("type") != "null"]
+        rest = {k: v for k, v in schema.items() if k != "anyOf"}
+        return _convert({**options[0], **rest, "nullable": True}, defs)
+
+    converted = {key: schema[key] for key in SCHEMA_KEYS if key in schema}
+    if "items" in schema:
+        converted["items"] = _convert(schema["items"], defs)
+    if "properties" in schema:
+        converted["properties"] = {
+            name: _convert(value, defs) for name, value in schema["properties"].items()
+        }
+        converted["required"] = schema.get("required", [])
+    return converted
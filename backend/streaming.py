@@ -0,0 +1,47 @@
+import ijson
+from typing import List
+from models import BacklogItem, DecisionNote, RiskAssumption
+
+# List entries forwarded to the client as soon as Gemini finishes each one
+STREAMED_SECTIONS = {
+    "backlog_items.item": ("backlog_items", BacklogItem),
+    "decision_log.item": ("decision_log", DecisionNote),
+    "risk_register.item": ("risk_register", RiskAssumption),
+}
+
+class PackageStreamParser:
+    """
+    Incrementally parse a streamed DocumentationPackage.
+    
+    Chunks of raw JSON are fed in as Gemini produces them; each call returns
+    the pieces that were completed by that chunk: the meeting summary and
+    validated backlog items, decisions and risks.
+    """
+    
+    def __init__(self):
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events)
+        self._builder = None
+        self._prefix = None
+    
+    def feed(self, chunk: str) -> List[dict]:
+        self._parser.send(chunk.encode())
+        
+        updates = []
+        for prefix, event, value in self._events:
+            if self._builder is not None:
+                self._builder.event(event, value)
+                if prefix == self._prefix and event == "end_map":
+                    section, model = STREAMED_SECTIONS[prefix]
+                    item = model.model_validate(self._builder.value)
+                    updates.append({"section": section, "item": item.model_dump(mode="json")})
+                    self._builder = None
+            elif prefix in STREAMED_SECTIONS and event == "start_map":
+                self._builder = ijson.ObjectBuilder()
+                self._builder.event(event, value)
+                self._prefix = prefix
+            elif prefix == "meeting_summary" and event == "string":
+                updates.append({"meeting_summary": value})
+        
+        del self._events[:]
+        return updates
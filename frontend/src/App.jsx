@@ -8,6 +8,8 @@ function App() {
   const [transcript, setTranscript] = useState('')
   const [modelChoice, setModelChoice] = useState('gemini-2.0-flash')
   const [documentation, setDocumentation] = useState(null)
+  const [streamingSummary, setStreamingSummary] = useState('')
+  const [streamingItems, setStreamingItems] = useState({})
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
   const [activeTab, setActiveTab] = useState('backlog')
@@ -39,9 +41,11 @@ PM: Good point. Let's also add two-factor authentication, but that can be a sepa
     setLoading(true)
     setError(null)
     setDocumentation(null)
+    setStreamingSummary('')
+    setStreamingItems({})
 
     try {
-      const response = await fetch(`${API_URL}/api/generate`, {
+      const response = await fetch(`${API_URL}/api/generate/stream`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
@@ -55,9 +59,47 @@ PM: Good point. Let's also add two-factor authentication, but that can be a sepa
         throw new Error(errorData.detail || 'Failed to generate documentation')
       }
 
-      const data = await response.json()
-      setDocumentation(data)
-      setActiveTab('backlog')
+      // Read the Server-Sent Events stream
+      const reader = response.body.getReader()
+      const decoder = new TextDecoder()
+      let buffer = ''
+      let finished = false
+
+      while (true) {
+        const { done, value } = await reader.read()
+        if (done) break
+
+        buffer += decoder.decode(value, { stream: true })
+        const events = buffer.split('\n\n')
+        buffer = events.pop()
+
+        for (const event of events) {
+          if (!event.startsWith('data: ')) continue
+          const payload = JSON.parse(event.slice(6))
+
+          if (payload.error) {
+            throw new Error(payload.error)
+          }
+          if (payload.meeting_summary) {
+            setStreamingSummary(payload.meeting_summary)
+          }
+          if (payload.section) {
+            setStreamingItems(prev => ({
+              ...prev,
+              [payload.section]: [...(prev[payload.section] || []), payload.item]
+            }))
+          }
+          if (payload.done) {
+            finished = true
+            setDocumentation(payload.package)
+            setActiveTab('backlog')
+          }
+        }
+      }
+
+      if (!finished) {
+        setError('Connection closed before generation finished')
+      }
     } catch (err) {
       setError(err.message)
     } finally {
@@ -206,6 +248,36 @@ PM: Good point. Let's also add two-factor authentication, but that can be a sepa
           </div>
         )}
 
+        {/* Streaming Preview */}
+        {loading && (streamingSummary || Object.keys(streamingItems).length > 0) && (
+          <section className="results">
+            {streamingSummary && (
+              <div className="summary-card">
+                <h3>Meeting Summary</h3>
+                <p>{streamingSummary}</p>
+              </div>
+            )}
+
+            <div className="stats">
+              <span>📋 Backlog Items: {(streamingItems.backlog_items || []).length}</span>
+              <span>📝 Decisions: {(streamingItems.decision_log || []).length}</span>
+              <span>🛡️ Risks: {(streamingItems.risk_register || []).length}</span>
+            </div>
+
+            {(streamingItems.backlog_items || []).map((item, index) => (
+              <div key={index} className="backlog-item">
+                <div className="item-header">
+                  <span className="item-id">{item.id}</span>
+                  <h4>{item.title}</h4>
+                </div>
+                <div className="user-story">
+                  <p>{item.user_story}</p>
+                </div>
+              </div>
+            ))}
+          </section>
+        )}
+
         {/* Results Section */}
         {documentation && (
           <section className="results">